@@ -1,13 +1,28 @@
 """Load water meter readings from Excel into TimescaleDB."""
 from __future__ import annotations
 
+import importlib.util
+import json
+import numbers
 import os
 import re
+import tempfile
 from dataclasses import dataclass
-from typing import Final
+from pathlib import Path
+from typing import Any, Final, Sequence
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from psycopg2 import sql
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection
+
+# Slices and column selections share memory until written to. Copy-on-Write
+# is the only mode from pandas 3, which deprecates the option.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
 
 EXCEL_PATH: Final[str] = r"E:\Integration\Projects\Astellas\Historical Data\Astellas - Water meters .xlsx"
 DB_NAME: Final[str] = os.environ.get("TIMESCALE_DB_NAME", "appdata")
@@ -21,11 +36,43 @@ DATABASE_URL: Final[str] = os.environ.get(
 )
 TARGET_SCHEMA: Final[str] = os.environ.get("TIMESCALE_SCHEMA", "public")
 TARGET_TABLE: Final[str] = os.environ.get("TIMESCALE_TABLE", "waltero_tqv")
+INSERT_METHOD: Final[str] = os.environ.get("TIMESCALE_INSERT_METHOD", "copy")
+BATCH_SIZE: Final[int] = 5000  # rows per multi-row INSERT when INSERT_METHOD is "batch"
+COPY_CHUNK_ROWS: Final[int] = 50_000  # rows rendered to CSV at a time while streaming COPY
 SKIP_ROWS: Final[int] = 4
 FRIENDLY_NAME_ROW: Final[int] = 2  # 1-based row number for descriptive headers
 DATE_COLUMN: Final[str] = "Date"
 SOURCE_SHEET: Final[str] = "Totaliser Reading"
 DAYFIRST: Final[bool] = True
+SLASH_DATE_FORMAT: Final[str] = "%d/%m/%Y" if DAYFIRST else "%m/%d/%Y"
+# Text dates in the sheet's slash layout plus the ISO text of cells Excel stored as dates.
+DATE_FORMATS: Final[tuple[str, ...]] = (
+    f"{SLASH_DATE_FORMAT} %H:%M:%S",
+    f"{SLASH_DATE_FORMAT} %H:%M",
+    SLASH_DATE_FORMAT,
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+EXCEL_SERIAL_RANGE: Final[tuple[float, float]] = (1.0, 2958465.0)  # serials for 1900-01-01 .. 9999-12-31
+EXCEL_EPOCH_OFFSET_DAYS: Final[float] = 25569.0  # days from 1899-12-30 (Excel serial 0) to 1970-01-01
+NANOSECONDS_PER_DAY: Final[float] = 86_400 * 1e9
+# Prefer the Rust-based calamine reader (pandas >= 2.2); otherwise open the
+# workbook with openpyxl in read-only mode so it streams rows instead of
+# building the full cell object graph.
+EXCEL_READ_OPTIONS: Final[dict[str, Any]] = (
+    {"engine": "calamine"}
+    if importlib.util.find_spec("python_calamine") is not None
+    else {"engine": "openpyxl", "engine_kwargs": {"read_only": True, "data_only": True}}
+)
+WHITESPACE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\s+")
+SHEET_CACHE_LOOKUP_KEY: Final[bytes] = b"friendly_lookup"  # Parquet metadata entry for the friendly headers
+SHEET_CACHE_KEY_KEY: Final[bytes] = b"sheet_cache_key"  # Parquet metadata entry for the inputs the cache was built from
+SHEET_CACHE_VERSION: Final[int] = 2  # bump whenever read_sheet or parse_dates changes what they produce
+OUTPUT_COLUMNS: Final[tuple[str, ...]] = ("time", "field_name", "topic", "value", "quality_code")
+READING_KEY_COLUMNS: Final[tuple[str, ...]] = ("topic", "field_name", "time")  # identity of one reading
+FIELD_NAME: Final[str] = "totalValue"
+QUALITY_CODE: Final[int] = 192
+STAGE_TABLE: Final[str] = "water_meter_stage"  # session-local temp table, dropped on commit
 
 
 @dataclass(frozen=True)
@@ -56,41 +103,191 @@ METER_CONFIGS: Final[tuple[MeterConfig, ...]] = (
 
 def normalize_label(label: str) -> str:
     """Normalize header labels for robust comparisons."""
-    return re.sub(r"\s+", " ", (label or "").strip()).casefold()
-
-
-def load_sheet(path: str) -> tuple[pd.DataFrame, dict[str, str]]:
-    """Load the shared worksheet that contains all meter columns."""
-    df = pd.read_excel(
-        path,
-        sheet_name=SOURCE_SHEET,
-        skiprows=SKIP_ROWS,
+    return WHITESPACE_PATTERN.sub(" ", (label or "").strip()).casefold()
+
+
+def column_labels(header_row: pd.Series) -> list[str]:
+    """Build column labels from a header row the way pandas' read_excel does."""
+    labels: list[str] = []
+    seen: dict[str, int] = {}
+    for idx, value in enumerate(header_row.tolist()):
+        label = f"Unnamed: {idx}" if pd.isna(value) else str(value).strip()
+        if label in seen:
+            seen[label] += 1
+            label = f"{label}.{seen[label]}"
+        else:
+            seen[label] = 0
+        labels.append(label)
+    return labels
+
+
+def is_number_cell(value: object) -> bool:
+    """Tell whether a worksheet cell was stored as a number rather than text."""
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def serial_dates(serial: pd.Series) -> pa.Array:
+    """Convert Excel serial day numbers to timestamps; values outside EXCEL_SERIAL_RANGE become null."""
+    days = pa.array(serial.where(serial.between(*EXCEL_SERIAL_RANGE)), type=pa.float64(), from_pandas=True)
+    serial_ns = pc.cast(
+        pc.round(pc.multiply(pc.subtract(days, EXCEL_EPOCH_OFFSET_DAYS), NANOSECONDS_PER_DAY)),
+        pa.int64(),
+    )
+    return pc.cast(serial_ns, pa.timestamp("ns"))
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """Parse sheet dates, recovering cells stored as Excel serial numbers."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    # Arrow kernels resolve the known layouts without per-cell Python work:
+    # the explicit date formats first, then Excel serial numbers. Only cells
+    # Excel stored as numbers count as serials here; digit-only text such as
+    # "2024" is left to pandas below.
+    text = pa.array(values.astype(str), type=pa.string())
+    parsed = pc.coalesce(
+        *(
+            pc.strptime(text, format=date_format, unit="ns", error_is_null=True)
+            for date_format in DATE_FORMATS
+        )
+    )
+    serial = pd.to_numeric(values.where(values.map(is_number_cell)), errors="coerce")
+    dates = pd.Series(
+        pc.coalesce(parsed, serial_dates(serial)).to_numpy(zero_copy_only=False),
+        index=values.index,
+        name=values.name,
     )
-    df.columns = df.columns.astype(str).str.strip()
 
-    header_rows = pd.read_excel(
+    # Any other layout still goes through pandas' flexible parser; numeric
+    # text it cannot read as a date is then tried as a serial, as before.
+    unresolved = dates.isna() & values.notna()
+    if unresolved.any():
+        leftover = values[unresolved]
+        fallback = pd.to_datetime(leftover, dayfirst=DAYFIRST, errors="coerce")
+        missing = fallback.isna() & leftover.map(lambda value: isinstance(value, str))
+        if missing.any():
+            fallback[missing] = serial_dates(pd.to_numeric(leftover[missing], errors="coerce")).to_numpy(
+                zero_copy_only=False
+            )
+        dates[unresolved] = fallback
+    return dates
+
+
+def read_sheet(path: str) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Read the shared worksheet from Excel and coerce its columns."""
+    # Parse the workbook once; the friendly-name and column header rows are
+    # sliced from the same grid as the data.
+    raw = pd.read_excel(
         path,
         sheet_name=SOURCE_SHEET,
         header=None,
-        nrows=FRIENDLY_NAME_ROW,
+        **EXCEL_READ_OPTIONS,
     )
+
+    df = raw.iloc[SKIP_ROWS + 1 :]
+    df.columns = column_labels(raw.iloc[SKIP_ROWS])
+    df = df.reset_index(drop=True)
+
+    # Every column other than the date holds meter readings; coercing them
+    # here also gives each column a single type that Parquet can store.
+    for column in df.columns:
+        if column == DATE_COLUMN:
+            df[column] = parse_dates(df[column])
+        else:
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+
     friendly_row_index = max(0, FRIENDLY_NAME_ROW - 1)
-    friendly_row = header_rows.iloc[friendly_row_index]
+    friendly_row = raw.iloc[friendly_row_index].tolist()
+
+    friendly_lookup = {
+        column: WHITESPACE_PATTERN.sub(" ", str(header_value or "").strip())
+        for column, header_value in zip(df.columns, friendly_row)
+    }
+
+    return df, friendly_lookup
+
 
-    friendly_lookup: dict[str, str] = {}
-    for idx, column in enumerate(df.columns):
-        header_value = friendly_row.iloc[idx] if idx < len(friendly_row) else ""
-        friendly_lookup[column] = re.sub(r"\s+", " ", str(header_value or "").strip())
+def sheet_cache_key(path: str) -> bytes:
+    """Describe the workbook and parse settings a cached sheet must match."""
+    source = Path(path).stat()
+    key = {
+        "version": SHEET_CACHE_VERSION,
+        "source_size": source.st_size,
+        "source_mtime_ns": source.st_mtime_ns,
+        "excel_engine": EXCEL_READ_OPTIONS["engine"],
+        "sheet": SOURCE_SHEET,
+        "skip_rows": SKIP_ROWS,
+        "friendly_name_row": FRIENDLY_NAME_ROW,
+        "date_column": DATE_COLUMN,
+        "dayfirst": DAYFIRST,
+        "date_formats": DATE_FORMATS,
+    }
+    return json.dumps(key, sort_keys=True).encode()
+
+
+def read_sheet_cache(cache: Path, cache_key: bytes) -> tuple[pd.DataFrame, dict[str, str]] | None:
+    """Read a worksheet cached by write_sheet_cache, or None if it was built from other inputs."""
+    metadata = pq.read_schema(cache).metadata or {}
+    if metadata.get(SHEET_CACHE_KEY_KEY) != cache_key:
+        return None
+    table = pq.read_table(cache)
+    friendly_lookup = json.loads(table.schema.metadata[SHEET_CACHE_LOOKUP_KEY])
+    return table.to_pandas(), friendly_lookup
+
+
+def write_sheet_cache(
+    cache: Path,
+    cache_key: bytes,
+    df: pd.DataFrame,
+    friendly_lookup: dict[str, str],
+) -> None:
+    """Store the coerced worksheet, its friendly headers and its cache key as Parquet."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[SHEET_CACHE_LOOKUP_KEY] = json.dumps(friendly_lookup).encode()
+    metadata[SHEET_CACHE_KEY_KEY] = cache_key
+
+    # Write next to the target and swap it in, so an interrupted write never
+    # leaves a truncated sidecar behind.
+    fd, temp_name = tempfile.mkstemp(dir=cache.parent, prefix=f".{cache.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table.replace_schema_metadata(metadata), temp_name, compression="snappy")
+        os.replace(temp_name, cache)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
 
+
+def load_sheet(path: str) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Load the shared worksheet, reusing the Parquet sidecar when it matches the workbook."""
+    cache = Path(path).with_suffix(".parquet")
+    cache_key = sheet_cache_key(path)
+    if cache.exists():
+        try:
+            cached = read_sheet_cache(cache, cache_key)
+        except (OSError, pa.ArrowException, KeyError, json.JSONDecodeError) as exc:
+            print(f"Could not read sheet cache {cache}: {exc}; re-reading the workbook.")
+        else:
+            if cached is not None:
+                return cached
+            print(f"Sheet cache {cache} is out of date; re-reading the workbook.")
+
+    df, friendly_lookup = read_sheet(path)
+    try:
+        write_sheet_cache(cache, cache_key, df, friendly_lookup)
+    except (OSError, pa.ArrowException) as exc:
+        print(f"Could not write sheet cache {cache}: {exc}")
     return df, friendly_lookup
 
 
-def load_dataframe(
+def check_meter(
     sheet_df: pd.DataFrame,
     friendly_lookup: dict[str, str],
     meter: MeterConfig,
-) -> pd.DataFrame:
-    """Prepare the DataFrame for a specific meter column."""
+) -> None:
+    """Ensure the sheet holds the meter's column under the expected friendly header."""
     if DATE_COLUMN not in sheet_df.columns:
         raise ValueError(f"Column '{DATE_COLUMN}' not found in sheet '{SOURCE_SHEET}'.")
     if meter.sheet_column not in sheet_df.columns:
@@ -103,48 +300,167 @@ def load_dataframe(
             f"expected '{meter.friendly_name}', found '{friendly_value}'."
         )
 
-    df = sheet_df[[DATE_COLUMN, meter.sheet_column]].copy()
-    df = df.rename(columns={meter.sheet_column: "M1"})
 
-    df["M1"] = pd.to_numeric(df["M1"], errors="coerce")
+def load_dataframe(sheet_df: pd.DataFrame, meters: Sequence[MeterConfig]) -> pd.DataFrame:
+    """Reshape the checked meter columns into one DataFrame of readings."""
+    topics = {meter.sheet_column: meter.topic for meter in meters}
 
-    date_series = pd.to_datetime(df["Date"], dayfirst=DAYFIRST, errors="coerce")
-    missing_dates = date_series.isna()
-    if missing_dates.any():
-        numeric_dates = pd.to_numeric(df.loc[missing_dates, "Date"], errors="coerce")
-        convertible = missing_dates & numeric_dates.notna()
-        date_series.loc[convertible] = pd.to_datetime(
-            numeric_dates.loc[convertible],
-            unit="D",
-            origin="1899-12-30",
-        )
-    df["Date"] = date_series
+    df = sheet_df[[DATE_COLUMN, *topics]].melt(
+        id_vars=DATE_COLUMN,
+        var_name="topic",
+        value_name="value",
+    )
+    df = df.rename(columns={DATE_COLUMN: "time"})
+    df = df.dropna(subset=["time", "value"])
 
-    df = df.dropna(subset=["Date", "M1"])
+    # Topics repeat on every row, so keep them as categories; insert_dataframe
+    # ships only the category codes.
+    df["topic"] = df["topic"].map(topics).astype(pd.CategoricalDtype(list(topics.values())))
 
-    df = df.rename(columns={"Date": "time", "M1": "value"})
-    df["field_name"] = "totalValue"
-    df["topic"] = meter.topic
-    df["quality_code"] = 192
+    return df[["time", "topic", "value"]]
 
-    df = df[["time", "field_name", "topic", "value", "quality_code"]]
-    df = df.sort_values("time").reset_index(drop=True)
 
-    return df
+class CsvChunkReader:
+    """File-like reader that renders a DataFrame as CSV one chunk of rows at a time."""
 
+    def __init__(self, df: pd.DataFrame, rows_per_chunk: int = COPY_CHUNK_ROWS) -> None:
+        self._chunks = (
+            df.iloc[start : start + rows_per_chunk].to_csv(
+                index=False,
+                header=False,
+                date_format="%Y-%m-%d %H:%M:%S.%f",
+            )
+            for start in range(0, len(df), rows_per_chunk)
+        )
+        self._chunk = ""
+        self._position = 0
+
+    def read(self, size: int = -1) -> str:
+        """Return up to ``size`` characters (all remaining if negative); "" marks the end of the data."""
+        if size < 0:
+            data = self._chunk[self._position :] + "".join(self._chunks)
+            self._chunk = ""
+            self._position = 0
+            return data
+        if self._position >= len(self._chunk):
+            self._chunk = next(self._chunks, "")
+            self._position = 0
+        data = self._chunk[self._position : self._position + size]
+        self._position += len(data)
+        return data
+
+
+def copy_dataframe(df: pd.DataFrame, table: str, connection: Connection) -> None:
+    """Stream the DataFrame into a table with PostgreSQL COPY."""
+    copy_statement = sql.SQL("COPY {table} ({columns}) FROM STDIN WITH (FORMAT CSV)").format(
+        table=sql.Identifier(table),
+        columns=sql.SQL(", ").join(sql.Identifier(column) for column in df.columns),
+    )
 
-def insert_dataframe(df: pd.DataFrame) -> int:
-    """Insert the DataFrame into TimescaleDB and return the number of rows."""
-    engine = create_engine(DATABASE_URL)
-    with engine.begin() as connection:
-        df.to_sql(
-            TARGET_TABLE,
-            connection,
-            schema=TARGET_SCHEMA,
-            if_exists="append",
-            index=False,
+    # Rendering the CSV chunk by chunk keeps only COPY_CHUNK_ROWS rows of text
+    # in memory instead of a second full copy of the readings.
+    # The DBAPI cursor shares the connection's open transaction.
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(copy_statement, CsvChunkReader(df))
+
+
+def batch_insert_dataframe(df: pd.DataFrame, table: str, connection: Connection) -> None:
+    """Insert the DataFrame with multi-row INSERT statements of BATCH_SIZE rows."""
+    df.to_sql(
+        table,
+        connection,
+        if_exists="append",
+        index=False,
+        method="multi",
+        chunksize=BATCH_SIZE,
+    )
+
+
+def insert_dataframe(df: pd.DataFrame, connection: Connection) -> int:
+    """Insert the readings into TimescaleDB and return the number of new rows."""
+    if INSERT_METHOD not in ("copy", "batch"):
+        raise ValueError(f"Unsupported insert method '{INSERT_METHOD}'; expected 'copy' or 'batch'.")
+
+    # Only time, topic code and value travel to the server; the topic text and
+    # the constant columns are filled in by the INSERT ... SELECT below, which
+    # also feeds the hypertable in time order so each chunk and its indexes
+    # are appended to in sequence. Readings that already exist in the target
+    # are skipped, so rerunning the load does not duplicate them.
+    stage = pd.DataFrame(
+        {
+            "time": df["time"],
+            "topic_id": df["topic"].cat.codes,
+            "value": df["value"],
+        }
+    )
+    create_stage = sql.SQL(
+        "CREATE TEMP TABLE {stage} "
+        "(time timestamp NOT NULL, topic_id smallint NOT NULL, value double precision NOT NULL) "
+        "ON COMMIT DROP"
+    ).format(stage=sql.Identifier(STAGE_TABLE))
+    insert_from_stage = sql.SQL(
+        "INSERT INTO {target} ({columns}) "
+        "SELECT stage.time, %(field_name)s, topics.topic, stage.value, %(quality_code)s "
+        "FROM {stage} AS stage "
+        "JOIN unnest(%(topics)s::text[]) WITH ORDINALITY AS topics (topic, position) "
+        "ON topics.position = stage.topic_id + 1 "
+        "ORDER BY stage.time "
+        "ON CONFLICT DO NOTHING"
+    ).format(
+        target=sql.Identifier(TARGET_SCHEMA, TARGET_TABLE),
+        columns=sql.SQL(", ").join(sql.Identifier(column) for column in OUTPUT_COLUMNS),
+        stage=sql.Identifier(STAGE_TABLE),
+    )
+
+    with connection.connection.cursor() as cursor:
+        # The whole load is one transaction; skip waiting on the WAL flush for
+        # its single commit. A crash just before it is durable loses the batch,
+        # which a rerun restores.
+        cursor.execute("SET LOCAL synchronous_commit = off")
+        cursor.execute(create_stage)
+    if INSERT_METHOD == "copy":
+        copy_dataframe(stage, STAGE_TABLE, connection)
+    else:
+        batch_insert_dataframe(stage, STAGE_TABLE, connection)
+    with connection.connection.cursor() as cursor:
+        cursor.execute(
+            insert_from_stage,
+            {
+                "field_name": FIELD_NAME,
+                "quality_code": QUALITY_CODE,
+                "topics": df["topic"].cat.categories.tolist(),
+            },
+        )
+        return cursor.rowcount
+
+
+def has_reading_unique_index(connection: Connection) -> bool:
+    """Report whether a unique index on the target can catch a repeated reading."""
+    # Only plain (non-partial, non-expression) unique indexes whose key columns
+    # all come from READING_KEY_COLUMNS count; a surrogate key such as
+    # ``id bigserial`` never conflicts on a reloaded reading.
+    with connection.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS ("
+            "SELECT 1 FROM pg_index AS i "
+            "JOIN pg_class AS c ON c.oid = i.indrelid "
+            "JOIN pg_namespace AS n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = %(schema)s AND c.relname = %(table)s "
+            "AND i.indisunique AND i.indpred IS NULL AND i.indexprs IS NULL "
+            "AND NOT EXISTS ("
+            "SELECT 1 FROM unnest(i.indkey::int2[]) WITH ORDINALITY AS k (attnum, position) "
+            "LEFT JOIN pg_attribute AS a ON a.attrelid = i.indrelid AND a.attnum = k.attnum "
+            "WHERE k.position <= i.indnkeyatts "
+            "AND (a.attname IS NULL OR a.attname::text <> ALL (%(columns)s::text[]))"
+            ")"
+            ")",
+            {
+                "schema": TARGET_SCHEMA,
+                "table": TARGET_TABLE,
+                "columns": list(READING_KEY_COLUMNS),
+            },
         )
-    return len(df)
+        return bool(cursor.fetchone()[0])
 
 
 def main() -> None:
@@ -153,26 +469,46 @@ def main() -> None:
 
     sheet_df, friendly_lookup = load_sheet(EXCEL_PATH)
 
-    total_inserted = 0
+    meters: list[MeterConfig] = []
     for meter in METER_CONFIGS:
         try:
-            df = load_dataframe(sheet_df, friendly_lookup, meter)
+            check_meter(sheet_df, friendly_lookup, meter)
         except ValueError as exc:
             print(f"{meter.friendly_name}: skipped (column not found) -> {exc}")
             continue
+        meters.append(meter)
 
-        if df.empty:
-            print(f"{meter.topic}: skipped (no valid rows after cleaning).")
-            continue
+    if not meters:
+        print("No rows inserted from any sheet; nothing written.")
+        return
 
-        inserted = insert_dataframe(df)
-        total_inserted += inserted
-        print(f"{meter.topic}: inserted {inserted} rows into {TARGET_SCHEMA}.{TARGET_TABLE}.")
+    readings = load_dataframe(sheet_df, meters)
+    row_counts = readings["topic"].value_counts()
+    for meter in meters:
+        prepared = int(row_counts.get(meter.topic, 0))
+        if prepared == 0:
+            print(f"{meter.topic}: skipped (no valid rows after cleaning).")
+        else:
+            print(f"{meter.topic}: prepared {prepared} rows.")
 
-    if total_inserted == 0:
+    if readings.empty:
         print("No rows inserted from any sheet; nothing written.")
-    else:
-        print(f"Total rows inserted: {total_inserted} into {TARGET_SCHEMA}.{TARGET_TABLE}.")
+        return
+
+    engine = create_engine(DATABASE_URL, pool_size=1)
+    with engine.begin() as connection:
+        if not has_reading_unique_index(connection):
+            print(
+                f"Warning: {TARGET_SCHEMA}.{TARGET_TABLE} has no unique index on "
+                f"({', '.join(READING_KEY_COLUMNS)}); "
+                "readings loaded by earlier runs will be inserted again."
+            )
+        total_inserted = insert_dataframe(readings, connection)
+    engine.dispose()
+
+    print(f"Total rows inserted: {total_inserted} into {TARGET_SCHEMA}.{TARGET_TABLE}.")
+    if total_inserted < len(readings):
+        print(f"Skipped {len(readings) - total_inserted} duplicate rows.")
 
 
 if __name__ == "__main__":